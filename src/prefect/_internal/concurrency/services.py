@@ -138,9 +138,14 @@ class QueueService(abc.ABC, Generic[T]):
 
     async def _main_loop(self):
         while True:
-            item: T = await self._queue_get_thread.submit(
-                create_call(self._queue.get)
-            ).aresult()
+            try:
+                # Items that are already enqueued can be collected without a
+                # round-trip to the worker thread
+                item: T = self._queue.get_nowait()
+            except queue.Empty:
+                item = await self._queue_get_thread.submit(
+                    create_call(self._queue.get)
+                ).aresult()
 
             if item is None:
                 logger.debug("Exiting service %r", self)
@@ -279,9 +284,14 @@ class BatchedQueueService(QueueService[T]):
             deadline = get_deadline(self._min_interval)
             while batch_size < self._max_batch_size:
                 try:
-                    item = await anyio.to_thread.run_sync(
-                        partial(self._queue.get, timeout=get_timeout(deadline))
-                    )
+                    try:
+                        # Items that are already enqueued can be collected without a
+                        # round-trip to a worker thread
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        item = await anyio.to_thread.run_sync(
+                            partial(self._queue.get, timeout=get_timeout(deadline))
+                        )
 
                     if item is None:
                         done = True
@@ -165,6 +165,19 @@ class PrefectHttpxClient(httpx.AsyncClient):
     """
 
     RETRY_MAX = 5
+    RETRY_EXCEPTIONS = (
+        httpx.ReadTimeout,
+        httpx.PoolTimeout,
+        httpx.ConnectTimeout,
+        # `ConnectionResetError` when reading socket raises as a `ReadError`
+        httpx.ReadError,
+        # Sockets can be closed during writes resulting in a `WriteError`
+        httpx.WriteError,
+        # Uvicorn bug, see https://github.com/PrefectHQ/prefect/issues/7512
+        httpx.RemoteProtocolError,
+        # HTTP2 bug, see https://github.com/PrefectHQ/prefect/issues/7442
+        httpx.LocalProtocolError,
+    )
 
     async def _send_with_retry(
         self,
@@ -256,19 +269,7 @@ class PrefectHttpxClient(httpx.AsyncClient):
                 status.HTTP_502_BAD_GATEWAY,
                 *PREFECT_CLIENT_RETRY_EXTRA_CODES.value(),
             },
-            retry_exceptions=(
-                httpx.ReadTimeout,
-                httpx.PoolTimeout,
-                httpx.ConnectTimeout,
-                # `ConnectionResetError` when reading socket raises as a `ReadError`
-                httpx.ReadError,
-                # Sockets can be closed during writes resulting in a `WriteError`
-                httpx.WriteError,
-                # Uvicorn bug, see https://github.com/PrefectHQ/prefect/issues/7512
-                httpx.RemoteProtocolError,
-                # HTTP2 bug, see https://github.com/PrefectHQ/prefect/issues/7442
-                httpx.LocalProtocolError,
-            ),
+            retry_exceptions=self.RETRY_EXCEPTIONS,
         )
 
         # Convert to a Prefect response to add nicer errors messages
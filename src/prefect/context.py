@@ -215,6 +215,8 @@ class FlowRunContext(RunContext):
         task_run_futures: A list of futures for task runs submitted within this flow run
         task_run_states: A list of states for task runs created within this flow run
         task_run_results: A mapping of result ids to task run states for this flow run
+        task_result_factories: A mapping of tasks to the result factories used for
+            their runs in this flow run
         flow_run_states: A list of states for flow runs created within this flow run
         sync_portal: A blocking portal for sync task/flow runs in an async flow
         timeout_scope: The cancellation scope for flow level timeouts
@@ -228,6 +230,7 @@ class FlowRunContext(RunContext):
 
     # Result handling
     result_factory: ResultFactory
+    task_result_factories: Dict[Any, ResultFactory] = Field(default_factory=dict)
 
     # Counter for task calls allowing unique
     task_run_dynamic_keys: Dict[str, int] = Field(default_factory=dict)
@@ -1078,14 +1078,19 @@ async def begin_task_map(
 
     map_length = list(lengths)[0]
 
+    # Default values for parameters are the same for every mapped call; inspect the
+    # signature once instead of once per child
+    parameter_defaults = get_parameter_defaults(task.fn)
+
     task_runs = []
     for i in range(map_length):
         call_parameters = {key: value[i] for key, value in iterable_parameters.items()}
-        call_parameters.update({key: value for key, value in static_parameters.items()})
+        # Static parameters are shared by reference across every mapped call
+        call_parameters.update(static_parameters)
 
         # Add default values for parameters; these are skipped earlier since they should
         # not be mapped over
-        for key, value in get_parameter_defaults(task.fn).items():
+        for key, value in parameter_defaults.items():
             call_parameters.setdefault(key, value)
 
         # Re-apply annotations to each key again
@@ -1322,6 +1327,15 @@ async def submit_task_run(
     if task_runner.concurrency_type == TaskConcurrencyType.SEQUENTIAL:
         logger.info(f"Executing {task_run.name!r} immediately...")
 
+    # The result factory only depends on the task and the flow run, so it is resolved
+    # once per task instead of on every submission
+    result_factory = flow_run_context.task_result_factories.get(task)
+    if result_factory is None:
+        result_factory = await ResultFactory.from_task(
+            task, client=flow_run_context.client
+        )
+        flow_run_context.task_result_factories[task] = result_factory
+
     future = await task_runner.submit(
         key=future.key,
         call=partial(
@@ -1330,9 +1344,7 @@ async def submit_task_run(
             task_run=task_run,
             parameters=parameters,
             wait_for=wait_for,
-            result_factory=await ResultFactory.from_task(
-                task, client=flow_run_context.client
-            ),
+            result_factory=result_factory,
             log_prints=should_log_prints(task),
             settings=prefect.context.SettingsContext.get().copy(),
         ),
@@ -1490,7 +1502,13 @@ async def orchestrate_task_run(
     Returns:
         The final state of the run
     """
-    flow_run = await client.read_flow_run(task_run.flow_run_id)
+    flow_run_context = FlowRunContext.get()
+    # Reuse the parent flow run when the task is executing in its context instead of
+    # reading it from the API for every task run
+    if flow_run_context and flow_run_context.flow_run.id == task_run.flow_run_id:
+        flow_run = flow_run_context.flow_run
+    else:
+        flow_run = await client.read_flow_run(task_run.flow_run_id)
     logger = task_run_logger(task_run, task=task, flow_run=flow_run)
 
     partial_task_run_context = PartialModel(
@@ -1550,6 +1568,9 @@ async def orchestrate_task_run(
     # flag to ensure we only update the task run name once
     run_name_set = False
 
+    # Read once rather than on every attempt and again when reporting the final state
+    debug_mode = PREFECT_DEBUG_MODE.value()
+
     # Only run the task if we enter a `RUNNING` state
     while state.is_running():
         # Need to create timeout_context from inside of loop so that a
@@ -1586,7 +1607,7 @@ async def orchestrate_task_run(
                         task_run.name = task_run_name
                         run_name_set = True
 
-                    if PREFECT_DEBUG_MODE.value():
+                    if debug_mode:
                         logger.debug(f"Executing {call_repr(task.fn, *args, **kwargs)}")
                     else:
                         logger.debug(
@@ -1645,7 +1666,7 @@ async def orchestrate_task_run(
                 state=state,
             )
 
-            if state.type != terminal_state.type and PREFECT_DEBUG_MODE:
+            if state.type != terminal_state.type and debug_mode:
                 logger.debug(
                     (
                         f"Received new state {state} when proposing final state"
@@ -1667,7 +1688,7 @@ async def orchestrate_task_run(
                 state = await propose_state(client, Running(), task_run_id=task_run.id)
 
     # If debugging, use the more complete `repr` than the usual `str` description
-    display_state = repr(state) if PREFECT_DEBUG_MODE else str(state)
+    display_state = repr(state) if debug_mode else str(state)
 
     logger.log(
         level=logging.INFO if state.is_completed() else logging.ERROR,
@@ -1682,10 +1703,11 @@ async def wait_for_task_runs_and_report_crashes(
 ) -> Literal[True]:
     crash_exceptions = []
 
-    # Gather states concurrently first
-    states = await gather(*(future._wait for future in task_run_futures))
-
-    for future, state in zip(task_run_futures, states):
+    # The task runs are already executing concurrently so their final states are
+    # awaited one at a time; this avoids spawning a waiter per future for large flows
+    # and reports each crash as soon as it is reached
+    for future in task_run_futures:
+        state = await future._wait()
         logger = task_run_logger(future.task_run)
 
         if not state.type == StateType.CRASHED:
@@ -385,21 +385,31 @@ class RemoteFileSystem(WritableFileSystem, WritableDeploymentStorage):
     async def read_path(self, path: str) -> bytes:
         path = self._resolve_path(path)
 
-        with self.filesystem.open(path, "rb") as file:
-            content = await run_sync_in_worker_thread(file.read)
+        return await run_sync_in_worker_thread(self._read_path, path)
 
-        return content
+    def _read_path(self, path: str) -> bytes:
+        # Opening a remote file may perform network calls so the entire read is done
+        # in a worker thread rather than just the call to `read`
+        with self.filesystem.open(path, "rb") as file:
+            return file.read()
 
     @sync_compatible
     async def write_path(self, path: str, content: bytes) -> str:
         path = self._resolve_path(path)
+
+        await run_sync_in_worker_thread(self._write_path, path, content)
+        return path
+
+    def _write_path(self, path: str, content: bytes) -> None:
+        # Creating directories and closing the file (which flushes the upload for many
+        # remote file systems) are blocking, so the entire write is done in a worker
+        # thread rather than just the call to `write`
         dirpath = path[: path.rindex("/")]
 
         self.filesystem.makedirs(dirpath, exist_ok=True)
 
         with self.filesystem.open(path, "wb") as file:
-            await run_sync_in_worker_thread(file.write, content)
-        return path
+            file.write(content)
 
     @property
     def filesystem(self) -> fsspec.AbstractFileSystem:
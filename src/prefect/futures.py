@@ -108,6 +108,19 @@ class PrefectFuture(Generic[R, A]):
         >>>     state = future.get_state()
     """
 
+    # A future is created for every task call; slots keep large fan-outs lean
+    __slots__ = (
+        "key",
+        "name",
+        "asynchronous",
+        "task_run",
+        "_final_state",
+        "_exception",
+        "_task_runner",
+        "_submitted",
+        "_loop",
+    )
+
     def __init__(
         self,
         name: str,
@@ -352,14 +352,20 @@ class ConcurrentTaskRunner(BaseTaskRunner):
     def __getstate__(self):
         """
         Allow the `ConcurrentTaskRunner` to be serialized by dropping the task group.
+
+        Results of submitted runs are dropped as well; they cannot be waited for after
+        serialization and would otherwise be included in the payload every time a
+        future referencing this task runner is serialized.
         """
         data = self.__dict__.copy()
         data.update({k: None for k in {"_task_group"}})
+        data.update({"_result_events": {}, "_results": {}, "_keys": set()})
         return data
 
     def __setstate__(self, data: dict):
         """
-        When deserialized, we will no longer have a reference to the task group.
+        When deserialized, we will no longer have a reference to the task group or the
+        results of submitted runs.
         """
         self.__dict__.update(data)
         self._task_group = None
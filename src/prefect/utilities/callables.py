@@ -151,14 +151,15 @@ def parameters_to_args_kwargs(
     The function _must_ have an identical signature to the original function or this
     will return an empty tuple and dict.
     """
-    function_params = dict(inspect.signature(fn).parameters).keys()
+    signature = inspect.signature(fn)
+    function_params = signature.parameters.keys()
     # Check for parameters that are not present in the function signature
     unknown_params = parameters.keys() - function_params
     if unknown_params:
         raise SignatureMismatchError.from_bad_params(
             list(function_params), list(parameters.keys())
         )
-    bound_signature = inspect.signature(fn).bind_partial()
+    bound_signature = signature.bind_partial()
     bound_signature.arguments = parameters
 
     return bound_signature.args, bound_signature.kwargs
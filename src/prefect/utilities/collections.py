@@ -217,6 +217,11 @@ class StopVisiting(BaseException):
     """
 
 
+# Types that cannot contain other expressions; `visit_collection` does not need to
+# check them against each supported collection type
+ATOMIC_TYPES = frozenset({bool, bytes, complex, float, int, str, type(None)})
+
+
 def visit_collection(
     expr,
     visit_fn: Callable[[Any], Any],
@@ -299,8 +304,9 @@ def visit_collection(
 
     # Then, visit every child of the expression recursively
 
-    # If we have reached the maximum depth, do not perform any recursion
-    if max_depth == 0:
+    # If we have reached the maximum depth or the expression cannot contain children,
+    # do not perform any recursion
+    if max_depth == 0 or type(expr) in ATOMIC_TYPES:
         return result if return_data else None
 
     # Get the expression type; treat iterators like lists
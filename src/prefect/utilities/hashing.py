@@ -13,6 +13,10 @@ if sys.version_info[:2] >= (3, 9):
 else:
     _md5 = hashlib.md5
 
+# Reused across calls to `hash_objects` to avoid constructing and validating a new
+# serializer model every time a hash is computed
+_HASH_SERIALIZER = JSONSerializer(dumps_kwargs={"sort_keys": True})
+
 
 def stable_hash(*args: Union[str, bytes], hash_algo=_md5) -> str:
     """Given some arguments, produces a stable 64-bit hash of their contents.
@@ -54,8 +58,7 @@ def hash_objects(*args, hash_algo=_md5, **kwargs) -> Optional[str]:
     On failure of both, `None` will be returned
     """
     try:
-        serializer = JSONSerializer(dumps_kwargs={"sort_keys": True})
-        return stable_hash(serializer.dumps((args, kwargs)), hash_algo=hash_algo)
+        return stable_hash(_HASH_SERIALIZER.dumps((args, kwargs)), hash_algo=hash_algo)
     except Exception:
         pass
 
@@ -41,7 +41,8 @@ async def critical_service_loop(
         run_once: if set, the loop will only run once then return
         jitter_range: if set, the interval will be a random variable (rv) drawn from
             a clamped Poisson distribution where lambda = interval and the rv is bound
-            between `interval * (1 - range) < rv < interval * (1 + range)`
+            between `interval * (1 - range) < rv < interval * (1 + range)`. During
+            backoff, the increased interval is used as lambda instead.
     """
 
     track_record: Deque[bool] = deque([True] * consecutive, maxlen=consecutive)
@@ -131,9 +132,10 @@ async def critical_service_loop(
         if run_once:
             return
 
+        sleep = interval * 2**backoff_count
         if jitter_range is not None:
-            sleep = clamped_poisson_interval(interval, clamping_factor=jitter_range)
-        else:
-            sleep = interval * 2**backoff_count
+            # Jitter the backed off interval so services that began failing together
+            # do not retry in lockstep
+            sleep = clamped_poisson_interval(sleep, clamping_factor=jitter_range)
 
         await anyio.sleep(sleep)
@@ -1670,6 +1670,30 @@ class TestDynamicKeyHandling:
         assert sorted([int(run.dynamic_key) for run in task_runs]) == [0, 0, 1, 1]
 
 
+class TestTaskResultFactories:
+    async def test_result_factory_is_created_once_per_task(self, monkeypatch):
+        from_task = AsyncMock(wraps=ResultFactory.from_task)
+        monkeypatch.setattr(ResultFactory, "from_task", from_task)
+
+        @task
+        def my_task(x):
+            return x
+
+        @task
+        def other_task():
+            return 1
+
+        @flow
+        def my_flow():
+            my_task.map([1, 2, 3])
+            my_task(4)
+            other_task()
+
+        my_flow()
+
+        assert from_task.call_count == 2
+
+
 class TestCreateThenBeginFlowRun:
     async def test_handles_bad_parameter_types(self, orion_client, parameterized_flow):
         state = await create_then_begin_flow_run(
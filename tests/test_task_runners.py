@@ -1,5 +1,10 @@
+from uuid import uuid4
+
+import cloudpickle
 import pytest
 
+from prefect.states import Completed
+
 # Import the local 'tests' module to pickle to ray workers
 from prefect.task_runners import ConcurrentTaskRunner, SequentialTaskRunner
 from prefect.testing.standard_test_suites import TaskRunnerStandardTestSuite
@@ -32,3 +37,19 @@ class TestConcurrentTaskRunner(TaskRunnerStandardTestSuite):
     @pytest.fixture
     def task_runner(self):
         yield ConcurrentTaskRunner()
+
+    async def test_results_are_not_pickled(self, task_runner):
+        async def fake_orchestrate_task_run():
+            return Completed()
+
+        key = uuid4()
+        async with task_runner.start():
+            await task_runner.submit(key=key, call=fake_orchestrate_task_run)
+            assert await task_runner.wait(key, 5) is not None
+
+            unpickled = cloudpickle.loads(cloudpickle.dumps(task_runner))
+
+        assert unpickled._results == {}
+        assert unpickled._result_events == {}
+        assert unpickled._keys == set()
+        assert task_runner._results != {}, "the original runner should be unchanged"
@@ -172,6 +172,32 @@ async def test_jittered_sleeps_between_loops(monkeypatch):
     assert max(sleep_times) < 42 * (1 + 0.3)
 
 
+async def test_jittered_sleeps_respect_backoff(monkeypatch):
+    workload = AsyncMock(
+        side_effect=[
+            httpx.TimeoutException("oofta"),
+            httpx.TimeoutException("boo"),
+            httpx.TimeoutException("oofta"),
+            UncapturedException,
+        ]
+    )
+    sleeper = AsyncMock()
+
+    monkeypatch.setattr("prefect.utilities.services.anyio.sleep", sleeper)
+
+    with pytest.raises(UncapturedException):
+        await critical_service_loop(
+            workload, 42, consecutive=3, backoff=2, jitter_range=0.3
+        )
+
+    assert workload.await_count == 4
+
+    sleep_times = [call.args[0] for call in sleeper.await_args_list]
+    assert all(42 * (1 - 0.3) < t < 42 * (1 + 0.3) for t in sleep_times[:2])
+    # The third failure begins backoff, doubling the interval before jitter
+    assert 84 * (1 - 0.3) < sleep_times[2] < 84 * (1 + 0.3)
+
+
 async def test_captures_all_http_500_errors():
     workload = AsyncMock(
         side_effect=[